@@ -21,10 +21,65 @@ class Regra:
             return ("erro", f"Erro ao aplicar regra '{self.nome}': {str(e)}")
 
 
+# ======================================================
+#  REGRAS PADRÃO (padrões compilados uma única vez)
+# ======================================================
+_RE_NORMA = re.compile(r"[^a-zA-Z0-9\s.,;:!?()\-áéíóúâêôãõçÁÉÍÓÚÂÊÔÃÕÇ\"'ªº%€$ººº\[\]]")
+_RE_ARGUMENTOS = re.compile(r"\b(portanto|logo|pois|assim|desse modo|por isso|consequentemente)\b")
+_RE_CONECTIVOS = re.compile(r"\b(e|mas|porém|entretanto|assim|além disso|portanto)\b")
+_RE_PRIMEIRA_PESSOA = re.compile(r"\b(eu|minha|meu|acho|penso)\b")
+
+
+def _montar_regras_padrao():
+    def r_norma(texto: str):
+        if _RE_NORMA.search(texto):
+            return ("erro", "Foram encontrados caracteres incomuns que sugerem erro de escrita.")
+        return ("ok", "Bom domínio da norma-padrão.")
+
+    def r_tema(texto: str):
+        if len(texto.split()) < 30:
+            return ("erro", "O texto é curto; pode não estar desenvolvendo o tema.")
+        return ("ok", "O texto parece tratar do tema de forma inicial.")
+
+    def r_argumentos(texto: str):
+        argumentos = len(_RE_ARGUMENTOS.findall(texto.lower()))
+        if argumentos < 1:
+            return ("erro", "Poucos conectores argumentativos (pouca articulação de argumentos).")
+        return ("ok", "Há presença de conectores argumentativos.")
+
+    def r_conectivos(texto: str):
+        conectivos = len(_RE_CONECTIVOS.findall(texto.lower()))
+        if conectivos < 1:
+            return ("erro", "Pouca utilização de conectivos para garantir coesão textual.")
+        return ("ok", "Uso adequado de conectivos.")
+
+    def r_tamanho(texto: str):
+        palavras = len(texto.split())
+        if palavras < 120:
+            return ("erro", f"Texto curto: {palavras} palavras (mínimo recomendado: 120).")
+        return ("ok", "Tamanho adequado conforme critério mínimo.")
+
+    def r_primeira_pessoa(texto: str):
+        if _RE_PRIMEIRA_PESSOA.search(texto.lower()):
+            return ("erro", "Uso de 1ª pessoa identificado (evitar em dissertativo-argumentativo).")
+        return ("ok", "Não há marcas claras de 1ª pessoa.")
+
+    return [
+        Regra("Norma-padrão", "Avalia uso formal da escrita.", r_norma),
+        Regra("Adequação ao tema", "Verifica cobertura do tema.", r_tema),
+        Regra("Pertinência dos argumentos", "Identifica conectores argumentativos.", r_argumentos),
+        Regra("Coesão textual", "Analisa uso de conectivos.", r_conectivos),
+        Regra("Tamanho mínimo", "Verifica se há ao menos 120 palavras.", r_tamanho),
+        Regra("Uso da 1ª pessoa", "Garantir impessoalidade do texto.", r_primeira_pessoa),
+    ]
+
+
 # ======================================================
 #  CORRETOR
 # ======================================================
 class CorretorRedacao:
+    _regras_cache = None  # lista de Regra compilada na primeira instância
+
     def __init__(self, db: Optional[object] = None):
         self.db = db
         self.modelos_file = "modelos.json"
@@ -60,48 +115,11 @@ class CorretorRedacao:
 
     # ====================== REGRAS ======================
     def _criar_regras_em_memoria(self):
-        def r_norma(texto: str):
-            if re.search(r"[^a-zA-Z0-9\s.,;:!?()\-áéíóúâêôãõçÁÉÍÓÚÂÊÔÃÕÇ\"'ªº%€$ººº\[\]]", texto):
-                return ("erro", "Foram encontrados caracteres incomuns que sugerem erro de escrita.")
-            return ("ok", "Bom domínio da norma-padrão.")
-
-        def r_tema(texto: str):
-            if len(texto.split()) < 30:
-                return ("erro", "O texto é curto; pode não estar desenvolvendo o tema.")
-            return ("ok", "O texto parece tratar do tema de forma inicial.")
-
-        def r_argumentos(texto: str):
-            argumentos = len(re.findall(r"\b(portanto|logo|pois|assim|desse modo|por isso|consequentemente)\b", texto.lower()))
-            if argumentos < 1:
-                return ("erro", "Poucos conectores argumentativos (pouca articulação de argumentos).")
-            return ("ok", "Há presença de conectores argumentativos.")
-
-        def r_conectivos(texto: str):
-            conectivos = len(re.findall(r"\b(e|mas|porém|entretanto|assim|além disso|portanto)\b", texto.lower()))
-            if conectivos < 1:
-                return ("erro", "Pouca utilização de conectivos para garantir coesão textual.")
-            return ("ok", "Uso adequado de conectivos.")
-
-        def r_tamanho(texto: str):
-            palavras = len(texto.split())
-            if palavras < 120:
-                return ("erro", f"Texto curto: {palavras} palavras (mínimo recomendado: 120).")
-            return ("ok", "Tamanho adequado conforme critério mínimo.")
-
-        def r_primeira_pessoa(texto: str):
-            if re.search(r"\b(eu|minha|meu|acho|penso)\b", texto.lower()):
-                return ("erro", "Uso de 1ª pessoa identificado (evitar em dissertativo-argumentativo).")
-            return ("ok", "Não há marcas claras de 1ª pessoa.")
-
-        regras = [
-            Regra("Norma-padrão", "Avalia uso formal da escrita.", r_norma),
-            Regra("Adequação ao tema", "Verifica cobertura do tema.", r_tema),
-            Regra("Pertinência dos argumentos", "Identifica conectores argumentativos.", r_argumentos),
-            Regra("Coesão textual", "Analisa uso de conectivos.", r_conectivos),
-            Regra("Tamanho mínimo", "Verifica se há ao menos 120 palavras.", r_tamanho),
-            Regra("Uso da 1ª pessoa", "Garantir impessoalidade do texto.", r_primeira_pessoa),
-        ]
-        return regras
+        # As funções das regras são montadas uma vez por processo; cada instância
+        # recebe seus próprios objetos Regra, então alterá-los não afeta as demais.
+        if CorretorRedacao._regras_cache is None:
+            CorretorRedacao._regras_cache = _montar_regras_padrao()
+        return [Regra(r.nome, r.descricao, r.func) for r in CorretorRedacao._regras_cache]
 
     # ====================== POPULAR REGRAS NO DB ======================
     def popular_regras_padrao(self):
@@ -145,3 +163,33 @@ class CorretorRedacao:
         })
 
         return feedback
+
+
+# ======================================================
+#  INSTÂNCIA COMPARTILHADA
+# ======================================================
+_corretor_compartilhado: Optional[CorretorRedacao] = None
+_corretor_cwd: Optional[str] = None
+
+
+def obter_corretor(db: Optional[object] = None) -> CorretorRedacao:
+    """Retorna um CorretorRedacao reutilizável para o mesmo DB.
+
+    Evita reconstruir o corretor (e reabrir modelos.json) a cada chamada.
+    Um novo corretor é criado quando o DB informado ou o diretório de trabalho
+    (onde fica modelos.json) muda. O corretor guarda uma referência ao DB:
+    chame resetar_corretor() ao fechar o banco.
+    """
+    global _corretor_compartilhado, _corretor_cwd
+    cwd = os.getcwd()
+    if _corretor_compartilhado is None or _corretor_compartilhado.db is not db or _corretor_cwd != cwd:
+        _corretor_compartilhado = CorretorRedacao(db)
+        _corretor_cwd = cwd
+    return _corretor_compartilhado
+
+
+def resetar_corretor() -> None:
+    """Descarta o corretor compartilhado (e a referência ao DB que ele mantém)."""
+    global _corretor_compartilhado, _corretor_cwd
+    _corretor_compartilhado = None
+    _corretor_cwd = None
@@ -3,6 +3,9 @@ import json
 import sqlite3
 from typing import Optional, List, Dict, Any
 
+# Versão do schema gravada em PRAGMA user_version; incremente ao alterar as DDLs.
+SCHEMA_VERSION = 1
+
 
 class Dissertacoes:
     """Modelo simples para representar uma dissertação (objetos de uso local)."""
@@ -69,8 +72,22 @@ class DB:
             print(f"Erro ao executar query: {e}\nSQL: {query}\nPARAMS: {params}")
             return None
 
-    def init_schema(self) -> None:
-        """Cria tabelas necessárias (executa cada DDL separadamente)."""
+    def schema_version(self) -> int:
+        """Retorna a versão do schema gravada no banco (0 se nunca inicializado)."""
+        cur = self._execute("PRAGMA user_version")
+        linha = cur.fetchone() if cur else None
+        return linha[0] if linha else 0
+
+    def init_schema(self, force: bool = False) -> None:
+        """Cria tabelas necessárias.
+
+        Se a versão gravada no banco já for SCHEMA_VERSION, nenhuma DDL é executada.
+        Caso contrário, todas as DDLs rodam em uma única transação junto com a
+        atualização da versão.
+        """
+        if not force and self.schema_version() == SCHEMA_VERSION:
+            return
+
         tabelas = [
             ('''
                 CREATE TABLE IF NOT EXISTS modelos (
@@ -132,8 +149,13 @@ class DB:
             ''')
         ]
 
-        for ddl in tabelas:
-            self._execute(ddl, commit=True)
+        script = "BEGIN;\n" + "\n".join(tabelas) + f"\nPRAGMA user_version = {SCHEMA_VERSION};\nCOMMIT;"
+        try:
+            self.conexao.executescript(script)
+        except Exception as e:
+            if self.conexao.in_transaction:
+                self.conexao.rollback()
+            print(f"Erro ao criar schema: {e}")
 
     def _inserir(self, tabela: str, dados: Dict[str, Any]) -> Optional[int]:
         if not dados:
@@ -305,9 +327,9 @@ class DB:
                 raise RuntimeError("Não foi possível inserir a versão da redação")
 
             # Lazy import para evitar import circular com Corretor.py
-            from Corretor import CorretorRedacao  # import local
+            from Corretor import obter_corretor  # import local
 
-            corretor = CorretorRedacao(db)
+            corretor = obter_corretor(db)
             feedback = corretor.analisar_redacao(texto, modelo_id)
 
             return {
@@ -0,0 +1,112 @@
+# bench_startup.py
+# Mede o custo de inicialização (cold start) e o overhead por chamada do corretor.
+#
+# Uso: python bench_startup.py [repeticoes]
+# Tudo roda em um diretório temporário; dissertacoes.db e modelos.json do projeto não são tocados.
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from Trabalho import DB
+from Corretor import CorretorRedacao, obter_corretor, resetar_corretor
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+TEXTO_PADRAO = os.path.join(RAIZ, "redacoes", "redacao1.txt")
+
+
+def _medir(func, repeticoes: int) -> float:
+    """Executa func `repeticoes` vezes e retorna o tempo médio em milissegundos."""
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        func()
+    return (time.perf_counter() - inicio) * 1000 / repeticoes
+
+
+def _imprimir(nome: str, ms: float) -> None:
+    print(f"{nome:<45} {ms:10.3f} ms")
+
+
+def bench_processo(pasta: str, repeticoes: int) -> None:
+    """Tempo de um processo novo até o banco e o corretor estarem prontos (como no cron)."""
+    db_path = os.path.join(pasta, "processo.db")
+    codigo = (
+        "import main; db = main.inicializar_banco(%r); "
+        "main.assegurar_regras_padrao(db); main.obter_corretor(db)" % db_path
+    )
+    env = dict(os.environ, PYTHONPATH=RAIZ)
+
+    def rodar():
+        subprocess.run([sys.executable, "-c", codigo], cwd=pasta, env=env, check=True, stdout=subprocess.DEVNULL)
+
+    rodar()  # primeira execução cria o schema e popula as regras
+    _imprimir("processo completo (schema já existente)", _medir(rodar, repeticoes))
+
+
+def bench_schema(pasta: str, repeticoes: int) -> None:
+    contador = iter(range(10 ** 9))
+
+    def schema_novo():
+        with DB(os.path.join(pasta, f"novo_{next(contador)}.db")) as db:
+            db.init_schema()
+
+    caminho = os.path.join(pasta, "existente.db")
+    with DB(caminho) as db:
+        db.init_schema()
+
+    def schema_existente():
+        with DB(caminho) as db:
+            db.init_schema()
+
+    def schema_forcado():
+        with DB(caminho) as db:
+            db.init_schema(force=True)
+
+    _imprimir("init_schema em banco novo", _medir(schema_novo, repeticoes))
+    _imprimir("init_schema com versão igual (sem DDL)", _medir(schema_existente, repeticoes))
+    _imprimir("init_schema forçado (DDL completa)", _medir(schema_forcado, repeticoes))
+
+
+def bench_corretor(pasta: str, repeticoes: int, texto: str) -> None:
+    with DB(os.path.join(pasta, "corretor.db"), create_schema=True) as db:
+        modelo_id = db.inserir_modelo("Bench", "Modelo do benchmark", {})
+
+        def sem_cache():
+            CorretorRedacao._regras_cache = None
+            CorretorRedacao(db)
+
+        _imprimir("CorretorRedacao() sem cache de regras", _medir(sem_cache, repeticoes))
+        _imprimir("CorretorRedacao() com cache de regras", _medir(lambda: CorretorRedacao(db), repeticoes))
+
+        resetar_corretor()
+        obter_corretor(db)
+        _imprimir("obter_corretor() reutilizado", _medir(lambda: obter_corretor(db), repeticoes))
+
+        corretor = obter_corretor(db)
+        _imprimir("analisar_redacao()", _medir(lambda: corretor.analisar_redacao(texto, modelo_id), repeticoes))
+        _imprimir(
+            "DB.salvar_redacao_em_arquivo()",
+            _medir(lambda: DB.salvar_redacao_em_arquivo(db, "Bench", modelo_id, "Bench", texto), repeticoes),
+        )
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    texto = DB.ler_redacao_de_arquivo(TEXTO_PADRAO) or "Texto de teste. " * 50
+
+    cwd_original = os.getcwd()
+    with tempfile.TemporaryDirectory() as pasta:
+        os.chdir(pasta)  # CorretorRedacao grava modelos.json no diretório atual
+        try:
+            print(f"=== BENCHMARK DE INICIALIZAÇÃO ({repeticoes} repetições) ===")
+            bench_processo(pasta, max(1, repeticoes // 20))
+            bench_schema(pasta, repeticoes)
+            bench_corretor(pasta, repeticoes, texto)
+        finally:
+            resetar_corretor()
+            os.chdir(cwd_original)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 import sys
 import os
 from Trabalho import DB
-from Corretor import CorretorRedacao
+from Corretor import obter_corretor
 
 # ====================== BANCO ======================
 def inicializar_banco(db_path="dissertacoes.db"):
@@ -122,7 +122,7 @@ def assegurar_regras_padrao(db):
     cur = db.cursor.execute("SELECT COUNT(*) AS c FROM regras")
     if cur.fetchone()['c'] == 0:
         print("Inserindo regras padrão...")
-        corretor = CorretorRedacao(db)
+        corretor = obter_corretor(db)
         try:
             corretor.popular_regras_padrao()
         except Exception as e:
@@ -177,7 +177,7 @@ def main():
     versao_id = salvar_versao(db, redacao_id, numero, texto)
     print(f"\nRedação salva como versão {numero} (ID da versão: {versao_id})")
 
-    corretor = CorretorRedacao(db)
+    corretor = obter_corretor(db)
     feedback = corretor.analisar_redacao(texto, modelo_id)
     imprimir_relatorio(feedback)
 
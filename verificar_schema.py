@@ -0,0 +1,91 @@
+# verificar_schema.py
+# Verificações do controle de versão do schema em DB.init_schema.
+#
+# Uso: python verificar_schema.py
+# Roda em bancos temporários; dissertacoes.db do projeto não é tocado.
+import os
+import sqlite3
+import tempfile
+
+from Trabalho import DB, SCHEMA_VERSION
+
+TABELAS = {'modelos', 'regras', 'exemplos', 'redacao', 'versoes', 'redacao_regras'}
+
+
+def _tabelas(db: DB) -> set:
+    cur = db.cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    return {linha['name'] for linha in cur.fetchall()}
+
+
+def verificar_banco_novo(pasta: str) -> None:
+    with DB(os.path.join(pasta, 'novo.db')) as db:
+        assert db.schema_version() == 0
+        db.init_schema()
+        assert db.schema_version() == SCHEMA_VERSION
+        assert TABELAS <= _tabelas(db)
+        assert not db.conexao.in_transaction
+
+
+def verificar_versao_igual_pula_ddl(pasta: str) -> None:
+    caminho = os.path.join(pasta, 'existente.db')
+    with DB(caminho) as db:
+        db.init_schema()
+        # Remove uma tabela sem mexer na versão: se a DDL rodar de novo, ela reaparece.
+        db.cursor.execute("DROP TABLE redacao_regras")
+        db.conexao.commit()
+
+    with DB(caminho) as db:
+        db.init_schema()
+        assert 'redacao_regras' not in _tabelas(db), "init_schema executou DDL com a versão já atual"
+        assert db.schema_version() == SCHEMA_VERSION
+
+
+def verificar_force_recria(pasta: str) -> None:
+    caminho = os.path.join(pasta, 'forcado.db')
+    with DB(caminho) as db:
+        db.init_schema()
+        db.cursor.execute("DROP TABLE redacao_regras")
+        db.conexao.commit()
+
+        db.init_schema(force=True)
+        assert TABELAS <= _tabelas(db)
+        assert db.schema_version() == SCHEMA_VERSION
+        assert not db.conexao.in_transaction
+
+
+def verificar_falha_faz_rollback(pasta: str) -> None:
+    def negar_ultima_tabela(acao, arg1, arg2, banco, origem):
+        if acao == sqlite3.SQLITE_CREATE_TABLE and arg1 == 'redacao_regras':
+            return sqlite3.SQLITE_DENY
+        return sqlite3.SQLITE_OK
+
+    with DB(os.path.join(pasta, 'falha.db')) as db:
+        # A última DDL falha: as tabelas criadas antes dela também devem ser desfeitas.
+        db.conexao.set_authorizer(negar_ultima_tabela)
+        db.init_schema()
+        db.conexao.set_authorizer(None)
+        assert not db.conexao.in_transaction
+        assert db.schema_version() == 0
+        assert not (TABELAS & _tabelas(db)), "DDL parcial não foi desfeita"
+
+        # Depois da falha, uma nova chamada cria o schema normalmente.
+        db.init_schema()
+        assert db.schema_version() == SCHEMA_VERSION
+        assert TABELAS <= _tabelas(db)
+
+
+def main():
+    verificacoes = [
+        verificar_banco_novo,
+        verificar_versao_igual_pula_ddl,
+        verificar_force_recria,
+        verificar_falha_faz_rollback,
+    ]
+    with tempfile.TemporaryDirectory() as pasta:
+        for verificacao in verificacoes:
+            verificacao(pasta)
+            print(f"OK  {verificacao.__name__}")
+
+
+if __name__ == "__main__":
+    main()